@@ -3,17 +3,118 @@
 from pathlib import Path
 import re
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import logging
-import datetime
-import os.path
+import os
 
-import dateutil
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
 
 DATA_FILE_PATTERN = "data_*_????_??_??_?.csv"
 EMPTY_FILE_STRING = "File is empty"
 
+# Fixed-width tail of a data file name: "_YYYY_MM_DD_N.csv"
+_FILENAME_SUFFIX_LEN = len("_????_??_??_?.csv")
+
+
+def _is_data_file_name(name: str) -> bool:
+    """Check that a file name looks like "data_<id>_YYYY_MM_DD_N.csv"
+
+    Slightly stricter than `DATA_FILE_PATTERN`: the date tail must be
+    digits, not arbitrary characters. Plain string operations keep the
+    check cheap per directory entry.
+    """
+    if not (name.startswith("data_") and name.endswith(".csv")):
+        return False
+    if len(name) <= len("data_") + _FILENAME_SUFFIX_LEN:
+        return False
+    tail = name[-_FILENAME_SUFFIX_LEN:]
+    # "_YYYY_MM_DD_N.csv"
+    return (
+        tail[0] == "_"
+        and tail[1:5].isdigit()
+        and tail[5] == "_"
+        and tail[6:8].isdigit()
+        and tail[8] == "_"
+        and tail[9:11].isdigit()
+        and tail[11] == "_"
+        and tail[12:13].isdigit()
+    )
+
+
+# Files larger than this are parsed in streaming batches to bound the
+# memory needed during the parse
+STREAMING_THRESHOLD = 64 * 2**20
+
+_LOGGER_ID_PATTERN = re.compile(r"^data_(\d+)")
+
+# Known timestamp formats, after the time separator has been fixed
+TIMESTAMP_FORMATS = ("%Y.%m.%d %H:%M", "%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M")
+
+# File format: https://tomst.com/web/en/systems/tms/software/
+DATA_FILE_SCHEMA = {
+    "measurement_id": pa.uint64(),
+    "timestamp": pa.timestamp("s"),
+    "time zone": pa.int8(),
+    # The sensors report 1/16 °C steps, which float32 represents
+    # exactly. float16 would halve the memory but has no native
+    # arithmetic on common CPUs, so operations on the returned frame
+    # would fall back to emulation through float32.
+    "T1": pa.float32(),
+    "T2": pa.float32(),
+    "T3": pa.float32(),
+    "soilmoist_count": pa.uint16(),
+    "shake": pa.uint8(),
+    "errFlag": pa.uint8(),
+}
+
+# Data files have a trailing field separator, so a surplus column name is
+# needed for reading; it is dropped again with `include_columns`.
+_READ_OPTIONS = pv.ReadOptions(
+    column_names=list(DATA_FILE_SCHEMA) + ["_trailing"],
+    autogenerate_column_names=False,
+    encoding="utf8",
+)
+_PARSE_OPTIONS = pv.ParseOptions(delimiter=";")
+
+# Timestamp formats tried by the CSV reader, covering both known date
+# separators and the dot-as-time-separator quirk
+_TIMESTAMP_PARSERS = [
+    "%Y.%m.%d %H:%M",
+    "%Y.%m.%d %H.%M",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H.%M",
+    "%Y/%m/%d %H:%M",
+    "%Y/%m/%d %H.%M",
+]
+
+
+def _make_convert_options(
+    decimal_point: str, timestamp_type: pa.DataType
+) -> pv.ConvertOptions:
+    return pv.ConvertOptions(
+        column_types=DATA_FILE_SCHEMA | {"timestamp": timestamp_type},
+        include_columns=list(DATA_FILE_SCHEMA),
+        decimal_point=decimal_point,
+        timestamp_parsers=_TIMESTAMP_PARSERS,
+    )
+
+
+# The Lolly software writes decimals with either a point or a comma
+# depending on the locale, so convert options are needed for both.
+# The primary options (parse_timestamps=True) decode timestamps in the
+# CSV reader's native parser; the string variants are a fallback for
+# timestamps in none of the known formats, parsed in pandas instead.
+_CONVERT_OPTIONS = {
+    (decimal_point, parse_timestamps): _make_convert_options(
+        decimal_point, pa.timestamp("s") if parse_timestamps else pa.string()
+    )
+    for decimal_point in (".", ",")
+    for parse_timestamps in (True, False)
+}
+
 
 class TMSDataReader:
     """Class for reading data files produced by the TOMST Lolly software
@@ -24,111 +125,242 @@ class TMSDataReader:
         loggers (list): Logger id’s in this dataset
     """
 
-    def __init__(self, data_dir: str | Path):
+    def __init__(
+        self, data_dir: str | Path, streaming_threshold: int = STREAMING_THRESHOLD
+    ):
         """_summary_
 
         Args:
             data_dir (str | Path): Source folder for reading data
+            streaming_threshold (int): File size in bytes above which a
+                file is parsed in streaming batches instead of in one shot
         """
         self.data_dir = Path(data_dir)
         if not self.data_dir.exists():
             raise FileExistsError(f"Directory '{data_dir}' not found!")
-        self._filepattern = DATA_FILE_PATTERN
+        self._paths_cache: list[tuple[Path, os.stat_result]] | None = None
+        self.streaming_threshold = streaming_threshold
+
+    def _iter_files(self):
+        """Iterate over (path, stat) pairs of data files matching
+        `DATA_FILE_PATTERN`
+
+        Filtering directory entries with plain string checks avoids the
+        fnmatch regex and per-entry Path construction that Path.glob
+        would pay for every non-matching file. The stat result comes
+        from the directory entry, saving a separate stat syscall per
+        file when reading.
+        """
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if _is_data_file_name(entry.name):
+                    yield Path(entry.path), entry.stat()
+
+    def _paths(self) -> list[tuple[Path, os.stat_result]]:
+        """Get data file (path, stat) pairs in name order, scanning the
+        directory on first access"""
+        if self._paths_cache is None:
+            self._paths_cache = sorted(self._iter_files(), key=lambda pair: pair[0])
+        return self._paths_cache
+
+    def refresh(self):
+        """Forget the cached file listing
+
+        Call this if files have been added to or removed from the data
+        directory after the reader was created.
+        """
+        self._paths_cache = None
 
     @property
     def filecount(self):
         """Get number of data files in this dataset"""
-        return sum(1 for _ in self.data_dir.glob(self._filepattern))
+        return len(self._paths())
 
     @property
     def loggers(self) -> set[int]:
         """Get logger id’s contained in this dataset"""
-        return set(
-            map(TMSDataReader._get_logger_id, self.data_dir.glob(self._filepattern))
-        )
+        return {TMSDataReader._get_logger_id(filepath) for filepath, _ in self._paths()}
 
     def check_missing(self, all_loggers: Iterable[int]) -> set:
         """Check against a list of logger id’s"""
         return set(all_loggers).difference(self.loggers)
 
     @staticmethod
-    def _read_file(filepath: Path) -> pd.DataFrame | None:
-        with open(filepath, encoding="utf8") as fp:
+    def _parse_timestamps(timestamps: pd.Series) -> pd.Series:
+        """Parse a series of timestamp strings
+
+        Dots as time separators are replaced with colons first, see:
+        https://github.com/dateutil/dateutil/issues/252. The time HH.MM
+        is fixed width at the end of the string, so the separator can
+        be replaced positionally without a regex.
+
+        The known formats are tried in order: an explicit format keeps
+        parsing on the C fast path instead of per-string inference.
+        """
+        fixed = timestamps.str.slice_replace(-3, -2, ":")
+        for fmt in TIMESTAMP_FORMATS:
+            try:
+                return pd.to_datetime(fixed, utc=True, format=fmt, cache=True)
+            except ValueError:
+                continue
+        # Fall back to format inference
+        return pd.to_datetime(fixed, utc=True)
+
+    @staticmethod
+    def _sniff_decimal_point(filepath: Path) -> str:
+        """Detect the decimal separator used in a data file
+
+        The field separator is a semicolon, so any comma on the first
+        line marks a file written with comma decimals.
+        """
+        with open(filepath, "rb") as fp:
+            first_line = fp.readline()
+        return "," if b"," in first_line else "."
+
+    @staticmethod
+    def _read_table(
+        filepath: Path,
+        convert_options: pv.ConvertOptions,
+        filesize: int,
+        streaming_threshold: int,
+    ) -> pa.Table:
+        if filesize > streaming_threshold:
+            # Stream large files batch by batch so the parse does not
+            # need the whole file decoded in memory at once
+            reader = pv.open_csv(
+                filepath,
+                read_options=_READ_OPTIONS,
+                parse_options=_PARSE_OPTIONS,
+                convert_options=convert_options,
+            )
+            return reader.read_all()
+        return pv.read_csv(
+            filepath,
+            read_options=_READ_OPTIONS,
+            parse_options=_PARSE_OPTIONS,
+            convert_options=convert_options,
+        )
+
+    @staticmethod
+    def _parse_file(
+        filepath: Path,
+        decimal_point: str,
+        filesize: int,
+        streaming_threshold: int,
+    ) -> pa.Table:
+        try:
+            return TMSDataReader._read_table(
+                filepath,
+                _CONVERT_OPTIONS[decimal_point, True],
+                filesize,
+                streaming_threshold,
+            )
+        except pa.ArrowInvalid:
+            # Retry with timestamps read as strings and parsed in
+            # pandas, for formats the CSV reader does not know
+            table = TMSDataReader._read_table(
+                filepath,
+                _CONVERT_OPTIONS[decimal_point, False],
+                filesize,
+                streaming_threshold,
+            )
+            timestamps = TMSDataReader._parse_timestamps(
+                table.column("timestamp").to_pandas()
+            )
+            return table.set_column(
+                table.schema.get_field_index("timestamp"),
+                "timestamp",
+                pa.Array.from_pandas(timestamps.dt.tz_convert(None)).cast(
+                    pa.timestamp("s")
+                ),
+            )
+
+    @staticmethod
+    def _read_file(
+        filepath: Path,
+        stat: os.stat_result,
+        streaming_threshold: int = STREAMING_THRESHOLD,
+    ) -> pa.Table | None:
+        decimal_point = TMSDataReader._sniff_decimal_point(filepath)
+        try:
             try:
-                df = pd.read_csv(
-                    fp,
-                    index_col=False,
-                    sep=";",
-                    header=None,
-                    # File format: https://tomst.com/web/en/systems/tms/software/
-                    names=[
-                        "measurement_id",
-                        "timestamp",
-                        "time zone",
-                        "T1",
-                        "T2",
-                        "T3",
-                        "soilmoist_count",
-                        "shake",
-                        "errFlag",
-                    ],
-                ).set_index("measurement_id")
-                # Parse timestamps
-                df["timestamp"] = pd.to_datetime(
-                    # Replace dots as time separators with colons,
-                    # see: https://github.com/dateutil/dateutil/issues/252
-                    df["timestamp"].str.replace(
-                        # Match only time HH.MM at the end of the string
-                        r"\d{2}.\d{2}$",
-                        lambda match: match.group().replace(".", ":"),
-                        regex=True,
-                    ),
-                    utc=True,
-                    infer_datetime_format=True,
+                table = TMSDataReader._parse_file(
+                    filepath, decimal_point, stat.st_size, streaming_threshold
+                )
+            except pa.ArrowInvalid:
+                # The probe misses comma decimals when the temperatures
+                # on the first line all happen to be integral, so try
+                # the opposite separator before giving up
+                decimal_point = "," if decimal_point == "." else "."
+                table = TMSDataReader._parse_file(
+                    filepath, decimal_point, stat.st_size, streaming_threshold
                 )
-            except (
-                pd.errors.ParserError,
-                dateutil.parser.ParserError,
-                ValueError,
-            ) as err:
-                fp.seek(0)
+        except (pa.ArrowInvalid, ValueError) as err:
+            with open(filepath, encoding="utf8") as fp:
                 if fp.readline().rstrip("\n") == EMPTY_FILE_STRING:
                     logging.warning("Empty file %s", filepath.name)
                 else:
                     logging.warning("Failed reading file %s: %s", filepath.name, err)
-                return None
+            return None
 
-        # Parse temperature columns as floats if this failed when reading the file
-        try:
-            df[["T1", "T2", "T3"]] = df[["T1", "T2", "T3"]].apply(
-                lambda ts: ts.str.replace(",", ".").astype(float)
-            )
-        except AttributeError:
-            pass  # values are already floats
-
-        # Add file modification time
-        df["read_time"] = datetime.datetime.fromtimestamp(
-            os.path.getmtime(filepath),
+        # Append the file modification time and logger id as constant
+        # columns so the tables can be concatenated flat
+        num_rows = table.num_rows
+        table = table.append_column(
+            "read_time",
+            pa.repeat(pa.scalar(int(stat.st_mtime), pa.timestamp("s")), num_rows),
         )
-
-        # Return data with duplicated rows removed
-        return df.drop_duplicates(keep="last")
+        logger_id = pa.scalar(TMSDataReader._get_logger_id(filepath), pa.uint32())
+        return table.append_column("logger_id", pa.repeat(logger_id, num_rows))
 
     @staticmethod
-    def _get_logger_id(filepath):
-        return int(re.match(r"^data_(\d+)", filepath.stem).group(1))
+    def _get_logger_id(filepath) -> int:
+        stem = filepath.stem
+        # Fast path for the standard "data_<id>_..." file name: slicing
+        # the id out directly avoids the regex engine per file
+        if stem.startswith("data_"):
+            rest = stem[len("data_") :]
+            end = rest.find("_")
+            digits = rest[:end] if end >= 0 else rest
+            if digits.isdigit():
+                return int(digits)
+        match = _LOGGER_ID_PATTERN.match(stem)
+        if match is None:
+            raise ValueError(f"No logger id in file name '{filepath.name}'")
+        return int(match.group(1))
 
     def read(self) -> pd.DataFrame:
         """Read data files into a Data Frame
 
-        Duplicated rows (timestamp and data) are removed automatically
-        leaving the last record.
+        Files are parsed in parallel using a thread pool. Duplicated
+        records (same measurement id) are removed automatically leaving
+        the last record.
         """
-        return pd.concat(
-            {
-                self._get_logger_id(filepath): self._read_file(filepath)
-                for filepath in self.data_dir.glob(self._filepattern)
-            },
-            names=["logger_id"],
-            axis=0,
-        )
+        files = self._paths()
+        # Cap the pool size to avoid oversubscription on huge directories
+        max_workers = max(1, min(32, len(files), os.cpu_count() or 1))
+
+        def read_file(file: tuple[Path, os.stat_result]) -> pa.Table | None:
+            return TMSDataReader._read_file(*file, self.streaming_threshold)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tables = [
+                table for table in executor.map(read_file, files) if table is not None
+            ]
+        if not tables:
+            raise ValueError(f"No data files could be read from '{self.data_dir}'")
+        # A single Arrow concatenation and a single conversion to pandas
+        # avoids copying every per-file frame twice; self_destruct frees
+        # the Arrow buffers as they are converted
+        combined = pa.concat_tables(tables)
+        # The concatenation is zero-copy, so the per-file tables pin the
+        # same buffers: drop them or self_destruct cannot free anything
+        tables.clear()
+        data = combined.to_pandas(self_destruct=True, split_blocks=True)
+        # Timestamps come out of the CSV reader naive; they are in UTC
+        data["timestamp"] = data["timestamp"].dt.tz_localize("UTC")
+        data = data.set_index(["logger_id", "measurement_id"])
+        # Remove duplicated records: the file listing is sorted, so for
+        # measurement ids repeated across a logger's files the most
+        # recent file wins
+        return data[~data.index.duplicated(keep="last")]